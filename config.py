@@ -1,24 +1,34 @@
 # config.py
 # A module defining the GameConfiguration class for storing game settings in the Space Invaders game.
 
-import pygame
 from typing import Tuple
 
+from sprite_atlas import SpriteAtlas
+
 
 class GameConfiguration:
     """A class to store all settings for Space Invaders."""
 
     def __init__(self) -> None:
         """Initialize the game's static settings."""
+        # Every game image comes from the sprite atlas bundle, if one has been built.
+        self.atlas_path = "images/sprites.atlas"
+        self.atlas = SpriteAtlas.load(self.atlas_path)
+
         # Screen settings
         self.screen_width = 1200
         self.screen_height = 800
         self.bg_color = (19, 19, 19)
-        self.game_icon = pygame.image.load("images/game_icon.png")
-        self.bg_image = pygame.image.load("images/background_image.png")
+        self.game_icon = self.atlas.image("game_icon")
+        self.bg_image = self.atlas.image("background_image")
+
+        # Scoreboard font settings, also used to pre-render glyphs into the sprite atlas.
+        self.font_path = "font/RetroGaming.ttf"
+        self.scoreboard_font_sizes = {"stage": 20, "score": 35, "highscore": 22}
 
         # Starfighter settings
         self.starfighter_limit = 3
+        self.starfighter_hit_pause = 1.0  # Seconds to pause after losing a starfighter
 
         # Bullet settings
         self.bullet_width = 5
@@ -29,6 +39,15 @@ class GameConfiguration:
         # Invader settings
         self.fleet_drop_speed = 10
 
+        # Enemy shot settings
+        self.enemy_shot_capacity = 4096  # Most shots that can be in flight at once
+        self.enemy_shot_width = 4
+        self.enemy_shot_height = 14
+        self.enemy_shot_color = (255, 90, 90)
+        self.enemy_volley_size = 1  # Shots fired at once by each firing invader
+        self.enemy_volley_spread = 1.5  # Horizontal speed between shots in a volley
+        self.enemy_fire_scale = 1.3  # How quickly invaders start firing more often
+
         # Invader image dimensions
         self.invaders_png_width = 60
         self.invaders_png_height = 44
@@ -37,6 +56,24 @@ class GameConfiguration:
         self.speedup_scale = 1.1  # How quickly the game speeds up
         self.score_scale = 1.5  # How quickly the invaders point values increase
 
+        # Frame pacing settings
+        self.target_fps = 60
+        self.adaptive_pacing = False  # Skip rendering under load instead of slowing down
+        self.max_skipped_frames = 3  # Most frames rendered in a row may be skipped
+        self.pacing_window = 120  # Frames of history used for estimates and metrics
+        self.pacing_spin_threshold = 0.002  # Seconds busy-waited before each deadline
+
+        # Input latency settings
+        self.track_input_latency = False  # Record input-to-photon latency histograms
+        self.latency_bucket_ms = 2  # Width of each histogram bucket
+        self.latency_max_age = 0.5  # Seconds before an input with no effect is dropped
+        self.latency_output_dir = "latency"
+
+        # Profiler capture settings
+        self.profile_capture_frames = 300  # Frames recorded per capture (5s at 60 FPS)
+        self.profile_sample_interval = 0.001  # CPU seconds between samples, rounded up to the OS tick
+        self.profile_output_dir = "profiles"
+
         self.initialize_dynamic_settings()
 
     def initialize_dynamic_settings(self) -> None:
@@ -44,6 +81,10 @@ class GameConfiguration:
         self.starfighter_speed = 3.5
         self.bullet_speed = 9.0
         self.invader_speed = 2.0
+        self.enemy_shot_speed = 4.0
+
+        # Chance per frame that the lowest invader in a column fires.
+        self.enemy_fire_chance = 0.004
 
         # Scoring
         self.invader_points = 50
@@ -59,5 +100,7 @@ class GameConfiguration:
         self.starfighter_speed *= self.speedup_scale
         self.bullet_speed *= self.speedup_scale
         self.invader_speed *= self.speedup_scale
+        self.enemy_shot_speed *= self.speedup_scale
+        self.enemy_fire_chance = min(1.0, self.enemy_fire_chance * self.enemy_fire_scale)
 
         self.invader_points = int(self.invader_points * self.score_scale)
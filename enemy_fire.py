@@ -0,0 +1,159 @@
+# enemy_fire.py
+# A module defining the EnemyProjectiles class for managing invader return fire in the Space Invaders game.
+
+from __future__ import annotations  # Postpone type hint evaluation
+
+import numpy as np
+import pygame
+from typing import TYPE_CHECKING, Dict, Iterable
+
+# To avoid circular imports during runtime
+if TYPE_CHECKING:
+    from invader import Invader
+    from config import GameConfiguration
+    from space_invaders import SpaceInvaders
+
+
+class EnemyProjectiles:
+    """
+    Manage every invader shot in preallocated arrays.
+
+    Shots are not sprites: their positions, velocities and active flags live in
+    fixed-size NumPy arrays, so moving, culling and colliding all of them takes
+    a handful of array operations no matter how many are on screen.
+    """
+
+    def __init__(self, game_instance: SpaceInvaders) -> None:
+        """
+        Preallocate the shot arrays and the shared shot surface.
+
+        Args:
+            game_instance (SpaceInvaders): The current game instance, providing
+            access to the screen and settings.
+        """
+        self.screen: pygame.Surface = game_instance.screen
+        self.settings: GameConfiguration = game_instance.settings
+        self.rng = np.random.default_rng()
+
+        self.width: int = self.settings.enemy_shot_width
+        self.height: int = self.settings.enemy_shot_height
+
+        # Top-left position and velocity of each shot slot, in pixels per frame.
+        capacity: int = self.settings.enemy_shot_capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+
+        # Every shot is drawn by blitting this one surface.
+        self.shot_image = pygame.Surface((self.width, self.height))
+        self.shot_image.fill(self.settings.enemy_shot_color)
+
+    def __len__(self) -> int:
+        """Return the number of shots currently in flight."""
+        return int(np.count_nonzero(self.active))
+
+    def clear(self) -> None:
+        """Remove every shot from the screen."""
+        self.active[:] = False
+
+    def fire(self, invaders: Iterable[Invader]) -> None:
+        """
+        Let the lowest live invader in each column randomly fire a volley.
+
+        Args:
+            invaders (Iterable[Invader]): The invaders currently in the fleet.
+        """
+        lowest: Dict[int, Invader] = {}
+        for invader in invaders:
+            current = lowest.get(invader.column)
+            if current is None or invader.rect.bottom > current.rect.bottom:
+                lowest[invader.column] = invader
+
+        if not lowest:
+            return
+
+        shooters = list(lowest.values())
+        firing = self.rng.random(len(shooters)) < self.settings.enemy_fire_chance
+        if not firing.any():
+            return
+
+        muzzles = np.array(
+            [shooter.rect.midbottom for shooter in shooters], dtype=np.float32
+        )[firing]
+        self.spawn_volleys(muzzles)
+
+    def spawn_volleys(self, muzzles: np.ndarray) -> None:
+        """
+        Place a fanned-out volley of shots below each muzzle position.
+
+        Args:
+            muzzles (np.ndarray): Array of shape (n, 2) holding the midbottom
+            point of each firing invader.
+        """
+        volley_size: int = self.settings.enemy_volley_size
+        spread = (np.arange(volley_size, dtype=np.float32) - (volley_size - 1) / 2) * (
+            self.settings.enemy_volley_spread
+        )
+
+        free_slots = np.flatnonzero(~self.active)
+        count = min(len(muzzles) * volley_size, len(free_slots))
+        if count == 0:
+            return
+        slots = free_slots[:count]
+
+        self.x[slots] = np.repeat(muzzles[:, 0] - self.width / 2, volley_size)[:count]
+        self.y[slots] = np.repeat(muzzles[:, 1], volley_size)[:count]
+        self.vx[slots] = np.tile(spread, len(muzzles))[:count]
+        self.vy[slots] = self.settings.enemy_shot_speed
+        self.active[slots] = True
+
+    def update(self) -> None:
+        """Move every shot and deactivate those that have left the screen."""
+        self.x += self.vx
+        self.y += self.vy
+
+        screen_rect = self.screen.get_rect()
+        self.active &= (
+            (self.y < screen_rect.bottom)
+            & (self.x + self.width > screen_rect.left)
+            & (self.x < screen_rect.right)
+        )
+
+    def check_hit(self, target: pygame.Rect) -> bool:
+        """
+        Check all shots against a rect and remove those that hit it.
+
+        Args:
+            target (pygame.Rect): The rect to test, usually the starfighter's.
+
+        Returns:
+            bool: True if at least one shot hit the target, False otherwise.
+        """
+        hits = (
+            self.active
+            & (self.x < target.right)
+            & (self.x + self.width > target.left)
+            & (self.y < target.bottom)
+            & (self.y + self.height > target.top)
+        )
+        if not hits.any():
+            return False
+
+        self.active &= ~hits
+        return True
+
+    def draw_shots(self) -> None:
+        """Draw every active shot to the screen in a single batched blit."""
+        slots = np.flatnonzero(self.active)
+        if len(slots) == 0:
+            return
+
+        positions = zip(
+            self.x[slots].astype(np.int32).tolist(),
+            self.y[slots].astype(np.int32).tolist(),
+        )
+        self.screen.blits(
+            [(self.shot_image, position) for position in positions], doreturn=False
+        )
@@ -0,0 +1,54 @@
+# fleet_benchmark.py
+# A script measuring how long it takes to respawn the invader fleet in the Space Invaders game.
+
+import os
+
+# Run without a window; must be set before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import timeit
+import argparse
+
+from space_invaders import SpaceInvaders
+from sprite_atlas import SpriteAtlas
+
+
+def respawn_from_template(game: SpaceInvaders) -> None:
+    """Respawn the fleet by resetting the pooled invaders, as the game does."""
+    game.invaders.empty()
+    game.create_invaders_fleet()
+
+
+def respawn_from_scratch(game: SpaceInvaders) -> None:
+    """
+    Respawn the fleet as the game did before fleet templates.
+
+    Every invader is created again and loads both of its frames from the PNG
+    files, without the sprite atlas or its image cache.
+    """
+    atlas = game.settings.atlas
+    game.settings.atlas = SpriteAtlas()
+    rows = sorted({slot_y for _, slot_y in game.fleet_template})
+
+    game.invaders.empty()
+    for slot_x, slot_y in game.fleet_template:
+        game.settings.atlas.cache.clear()
+        invader = game.load_invader_image(rows.index(slot_y))
+        invader.reset_invader(slot_x, slot_y)
+        game.invaders.add(invader)
+
+    game.settings.atlas = atlas
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark invader fleet respawn time.")
+    parser.add_argument("--repeat", type=int, default=200, help="respawns per measurement")
+    args = parser.parse_args()
+
+    game = SpaceInvaders()
+    for name, respawn in (
+        ("from scratch", respawn_from_scratch),
+        ("from template", respawn_from_template),
+    ):
+        seconds = timeit.timeit(lambda: respawn(game), number=args.repeat)
+        print(f"{name:>14}: {seconds / args.repeat * 1000:.3f} ms per fleet")
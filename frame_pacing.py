@@ -0,0 +1,125 @@
+# frame_pacing.py
+# A module defining the FramePacer class for adaptive frame pacing in the Space Invaders game.
+
+from __future__ import annotations  # Postpone type hint evaluation
+
+import time
+from collections import deque
+from statistics import fmean, pstdev
+from typing import TYPE_CHECKING, Deque, Dict
+
+# To avoid circular imports during runtime
+if TYPE_CHECKING:
+    from config import GameConfiguration
+    from space_invaders import SpaceInvaders
+
+
+class FramePacer:
+    """
+    Keep the simulation at a fixed rate and skip rendering when frames overrun.
+
+    Every iteration of the main loop updates the game once. Rendering is skipped
+    when the estimated render cost would push the frame past its deadline, up
+    to a limit of consecutive skipped frames so the screen never freezes. A
+    skipped frame does not wait for its deadline, so the time saved goes to
+    catching the simulation up and the next render starts on schedule.
+    """
+
+    def __init__(self, game_instance: SpaceInvaders) -> None:
+        """
+        Initialize the pacer and its metrics.
+
+        Args:
+            game_instance (SpaceInvaders): The current game instance, providing
+            access to the game settings.
+        """
+        self.settings: GameConfiguration = game_instance.settings
+        self.frame_budget = 1.0 / self.settings.target_fps
+
+        # Recent render durations and intervals between rendered frames, in seconds.
+        self.render_times: Deque[float] = deque(maxlen=self.settings.pacing_window)
+        self.frame_intervals: Deque[float] = deque(maxlen=self.settings.pacing_window)
+
+        self.deadline = time.perf_counter() + self.frame_budget
+        self.render_start = 0.0
+        self.last_presented = 0.0
+        self.skipped_this_frame = False
+
+        self.rendered_frames = 0
+        self.skipped_frames = 0
+        self.consecutive_skips = 0
+
+    def should_render(self) -> bool:
+        """
+        Decide whether the current frame can be rendered within its budget.
+
+        Returns:
+            bool: True if the frame should be rendered, False to skip it.
+        """
+        now = time.perf_counter()
+        render_estimate = fmean(self.render_times) if self.render_times else 0.0
+        over_budget = now + render_estimate > self.deadline
+
+        if over_budget and self.consecutive_skips < self.settings.max_skipped_frames:
+            self.skipped_frames += 1
+            self.consecutive_skips += 1
+            self.skipped_this_frame = True
+            return False
+
+        self.render_start = now
+        self.skipped_this_frame = False
+        return True
+
+    def frame_rendered(self) -> None:
+        """Record how long the frame that was just rendered took to draw."""
+        now = time.perf_counter()
+        self.render_times.append(now - self.render_start)
+        if self.last_presented:
+            self.frame_intervals.append(now - self.last_presented)
+        self.last_presented = now
+
+        self.rendered_frames += 1
+        self.consecutive_skips = 0
+
+    def wait_for_next_frame(self) -> None:
+        """
+        Wait until the current frame's deadline and schedule the next one.
+
+        Sleeps for most of the remaining time and busy-waits the final stretch,
+        which is far more precise than sleeping alone. Skipped frames return at
+        once. If the loop has fallen too far behind, the schedule is reset
+        instead of trying to catch up.
+        """
+        if not self.skipped_this_frame:
+            remaining = self.deadline - time.perf_counter()
+            if remaining > self.settings.pacing_spin_threshold:
+                time.sleep(remaining - self.settings.pacing_spin_threshold)
+            while time.perf_counter() < self.deadline:
+                pass
+
+        now = time.perf_counter()
+        self.deadline += self.frame_budget
+        if now - self.deadline > self.frame_budget * self.settings.max_skipped_frames:
+            self.deadline = now + self.frame_budget
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Return frame pacing statistics for the recent window.
+
+        Returns:
+            Dict[str, float]: Counts of rendered and skipped frames, the skip
+            ratio, the rendered frame rate, and the mean, jitter and maximum of
+            the intervals between rendered frames in milliseconds.
+        """
+        total_frames = self.rendered_frames + self.skipped_frames
+        intervals = self.frame_intervals or [0.0]
+        mean_interval = fmean(intervals)
+        return {
+            "rendered_frames": self.rendered_frames,
+            "skipped_frames": self.skipped_frames,
+            "skip_ratio": self.skipped_frames / total_frames if total_frames else 0.0,
+            "rendered_fps": 1.0 / mean_interval if mean_interval else 0.0,
+            "mean_frame_ms": mean_interval * 1000,
+            "jitter_ms": pstdev(intervals) * 1000,
+            "max_frame_ms": max(intervals) * 1000,
+        }
@@ -0,0 +1,159 @@
+# input_latency.py
+# A module defining the InputLatencyTracker class for measuring input-to-photon latency in the Space Invaders game.
+
+from __future__ import annotations  # Postpone type hint evaluation
+
+import os
+import json
+import time
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, DefaultDict, Dict, List, Tuple
+
+import pygame
+
+# To avoid circular imports during runtime
+if TYPE_CHECKING:
+    from config import GameConfiguration
+    from space_invaders import SpaceInvaders
+
+
+# The kind of simulation change each tracked key is expected to cause.
+INPUT_KINDS: Dict[int, str] = {
+    pygame.K_LEFT: "move",
+    pygame.K_RIGHT: "move",
+    pygame.K_SPACE: "fire",
+}
+
+
+class InputLatencyTracker:
+    """
+    Measure the delay between pulling an input event and presenting its result.
+
+    Each input goes through three steps: it is stamped when pulled from the event
+    queue, tagged when the simulation first changes because of it, and recorded
+    when the first frame showing that change has been flipped to the display.
+    """
+
+    def __init__(self, game_instance: SpaceInvaders) -> None:
+        """
+        Initialize empty latency histograms.
+
+        Args:
+            game_instance (SpaceInvaders): The current game instance, providing
+            access to the game settings and frame pacer.
+        """
+        self.game: SpaceInvaders = game_instance
+        self.settings: GameConfiguration = game_instance.settings
+
+        # (key, kind, pulled_at) for inputs waiting for a simulation change,
+        # and for changes waiting for a flip.
+        self.pending: List[Tuple[int, str, float]] = []
+        self.applied: List[Tuple[int, str, float]] = []
+
+        # Latency histograms per input kind, keyed by bucket start in milliseconds.
+        self.histograms: DefaultDict[str, Counter] = defaultdict(Counter)
+        self.samples: DefaultDict[str, List[float]] = defaultdict(list)
+
+    def key_pressed(self, key: int, pulled_at: float) -> None:
+        """
+        Record a keypress pulled from the event queue.
+
+        Args:
+            key (int): The key code of the KEYDOWN event.
+            pulled_at (float): time.perf_counter() value when the event was pulled.
+        """
+        kind = INPUT_KINDS.get(key)
+        if kind is not None:
+            self.pending.append((key, kind, pulled_at))
+
+    def key_released(self, key: int) -> None:
+        """
+        Forget keypresses that ended without changing the simulation.
+
+        Args:
+            key (int): The key code of the KEYUP event.
+        """
+        self.pending = [entry for entry in self.pending if entry[0] != key]
+
+    def mark_applied(self, kind: str) -> None:
+        """
+        Tag pending inputs of a kind as having changed the simulation.
+
+        Args:
+            kind (str): The kind of input whose effect has just been simulated.
+        """
+        if not self.pending:
+            return
+
+        still_pending = []
+        for entry in self.pending:
+            (self.applied if entry[1] == kind else still_pending).append(entry)
+        self.pending = still_pending
+
+    def frame_presented(self) -> None:
+        """Record latencies for every applied input shown by the frame just flipped."""
+        if not self.applied and not self.pending:
+            return
+
+        presented_at = time.perf_counter()
+        bucket_ms = self.settings.latency_bucket_ms
+        for _, kind, pulled_at in self.applied:
+            latency_ms = (presented_at - pulled_at) * 1000
+            self.samples[kind].append(latency_ms)
+            self.histograms[kind][int(latency_ms // bucket_ms) * bucket_ms] += 1
+        self.applied = []
+
+        # Drop inputs that never caused a change, like firing with no bullets left.
+        oldest_allowed = presented_at - self.settings.latency_max_age
+        self.pending = [entry for entry in self.pending if entry[2] >= oldest_allowed]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return latency statistics for each kind of input.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Sample count, mean, median, 95th
+            percentile and maximum latency in milliseconds per input kind.
+        """
+        stats = {}
+        for kind, samples in self.samples.items():
+            ordered = sorted(samples)
+            stats[kind] = {
+                "count": len(ordered),
+                "mean_ms": sum(ordered) / len(ordered),
+                "p50_ms": ordered[len(ordered) // 2],
+                "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "max_ms": ordered[-1],
+            }
+        return stats
+
+    def write_report(self) -> None:
+        """
+        Write the session's histograms and summary to a timestamped JSON file.
+
+        The frame pacing settings and metrics are included, so reports from
+        sessions with different pacing can be compared.
+        """
+        if not self.samples:
+            return
+
+        output_dir: str = self.settings.latency_output_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        report = {
+            "adaptive_pacing": self.settings.adaptive_pacing,
+            "target_fps": self.settings.target_fps,
+            "pacing_metrics": (
+                self.game.frame_pacer.metrics() if self.game.frame_pacer else None
+            ),
+            "bucket_ms": self.settings.latency_bucket_ms,
+            "summary": self.summary(),
+            "histograms": {
+                kind: dict(sorted(histogram.items()))
+                for kind, histogram in self.histograms.items()
+            },
+        }
+        report_path = os.path.join(output_dir, f"latency-{timestamp}.json")
+        with open(report_path, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
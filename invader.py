@@ -25,8 +25,8 @@ class Invader(Sprite):
         Args:
             game_instance (SpaceInvaders): The current game instance, providing
             access to the screen and settings.
-            frame_one (str): File path to the first frame of the invader animation.
-            frame_two (str): File path to the second frame of the invader animation.
+            frame_one (str): Atlas name of the first frame of the invader animation.
+            frame_two (str): Atlas name of the second frame of the invader animation.
         """
         super().__init__()
         self.screen: pygame.Surface = game_instance.screen
@@ -37,8 +37,8 @@ class Invader(Sprite):
         self.current_sprite = 0
 
         # Append the frame to the invader_frames list to use for animation.
-        self.invader_frames.append(pygame.image.load(frame_one))
-        self.invader_frames.append(pygame.image.load(frame_two))
+        self.invader_frames.append(self.settings.atlas.image(frame_one))
+        self.invader_frames.append(self.settings.atlas.image(frame_two))
 
         # Load invader frame depending on the current_sprite variable and set the rect.
         self.image: pygame.Surface = self.invader_frames[self.current_sprite]
@@ -51,6 +51,24 @@ class Invader(Sprite):
         # Store the invaders precise horisontal position as a float.
         self.x = float(self.rect.x)
 
+        # Fleet column, used to pick which invaders can fire.
+        self.column = 0
+
+    def reset_invader(self, x: int, y: int) -> None:
+        """
+        Move the invader to a fleet slot and restart its animation.
+
+        Args:
+            x (int): The x-coordinate of the fleet slot.
+            y (int): The y-coordinate of the fleet slot.
+        """
+        self.rect.x = x
+        self.rect.y = y
+        self.x = float(x)
+
+        self.current_sprite = 0
+        self.image = self.invader_frames[self.current_sprite]
+
     def update(self) -> None:
         """Move the invader right or left across the screen."""
         self.x += self.settings.invader_speed * self.settings.fleet_direction
@@ -0,0 +1,194 @@
+# profiler_capture.py
+# A module defining the ProfilerCapture class for on-demand profiling of the Space Invaders game loop.
+
+from __future__ import annotations  # Postpone type hint evaluation
+
+import os
+import time
+import signal
+import cProfile
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+# To avoid circular imports during runtime
+if TYPE_CHECKING:
+    from types import CodeType, FrameType
+    from config import GameConfiguration
+    from space_invaders import SpaceInvaders
+
+
+class ProfilerCapture:
+    """
+    Profile the next N frames of the running game and write the results to disk.
+
+    The collapsed-stack file is built by a CPU-time interval timer whose signal
+    handler runs on the game thread and records the Python stack it interrupted.
+    Python only runs signal handlers between bytecodes, so a sample that fires
+    inside a C function, such as a pygame blit, is recorded when that call
+    returns and lands on the Python function that made it. Platforms without
+    signal.setitimer, such as Windows, get the .pstats file only.
+    """
+
+    def __init__(self, game_instance: SpaceInvaders) -> None:
+        """
+        Initialize the capture in its idle state.
+
+        Args:
+            game_instance (SpaceInvaders): The current game instance, providing
+            access to the game settings.
+        """
+        self.settings: GameConfiguration = game_instance.settings
+
+        # Checked once per frame by the main loop; nothing else runs while idle.
+        self.active = False
+        self.frames_left = 0
+
+        self.profiler: Optional[cProfile.Profile] = None
+        self.previous_handler: Any = None
+        self.stack_counts: Counter = Counter()
+
+        # Set while a sample is taken, so a signal arriving meanwhile is ignored.
+        self.sampling = False
+
+        # Frame labels per code object, so each function is formatted only once.
+        self.labels: Dict[CodeType, str] = {}
+
+        # Path prefix of the most recent capture, without file extension.
+        self.last_capture: Optional[str] = None
+
+    def start(self) -> None:
+        """Begin profiling the main thread for the configured number of frames."""
+        if self.active:
+            return
+
+        self.active = True
+        self.frames_left = self.settings.profile_capture_frames
+        self.stack_counts = Counter()
+
+        # Sample the game thread's stack every profile_sample_interval of CPU time.
+        if hasattr(signal, "setitimer"):
+            self.previous_handler = signal.signal(signal.SIGPROF, self.sample_stack)
+            interval: float = self.settings.profile_sample_interval
+            signal.setitimer(signal.ITIMER_PROF, interval, interval)
+
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+    def frame_done(self) -> None:
+        """Count down one captured frame and finish the capture when none remain."""
+        self.frames_left -= 1
+        if self.frames_left <= 0:
+            self.stop()
+
+    def stop(self) -> None:
+        """Turn profiling off and write the captured data to disk."""
+        if not self.active:
+            return
+
+        self.profiler.disable()
+        if hasattr(signal, "setitimer"):
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self.previous_handler)
+        self.active = False
+
+        self.write_capture()
+        self.profiler = None
+
+    def sample_stack(self, signum: int, frame: Optional[FrameType]) -> None:
+        """
+        Record the interrupted call stack. Runs as the SIGPROF signal handler.
+
+        Args:
+            signum (int): The signal number.
+            frame (Optional[FrameType]): The frame that was running when the
+            signal arrived.
+        """
+        if frame is None or self.sampling:
+            return
+
+        self.sampling = True
+        self.stack_counts[self.collapse_stack(frame)] += 1
+        self.sampling = False
+
+    def collapse_stack(self, frame: FrameType) -> str:
+        """
+        Convert a frame and its callers into a single collapsed-stack line.
+
+        Args:
+            frame (FrameType): The innermost frame of the sampled stack.
+
+        Returns:
+            str: Semicolon separated frames ordered from outermost to innermost.
+        """
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            label = self.labels.get(code)
+            if label is None:
+                label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                self.labels[code] = label
+            names.append(label)
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def write_capture(self) -> None:
+        """Write a .pstats file and a collapsed-stack file for flame graph tools."""
+        output_dir: str = self.settings.profile_output_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Millisecond resolution keeps short captures from overwriting each other.
+        now = time.time()
+        milliseconds = int(now * 1000) % 1000
+        timestamp = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{milliseconds:03d}"
+        capture_path = os.path.join(output_dir, f"capture-{timestamp}")
+
+        self.profiler.dump_stats(f"{capture_path}.pstats")
+        if hasattr(signal, "setitimer"):
+            with open(f"{capture_path}.collapsed", "w", encoding="utf-8") as stacks_file:
+                for stack, count in self.stack_counts.most_common():
+                    stacks_file.write(f"{stack} {count}\n")
+
+        self.last_capture = capture_path
+
+
+def python_hotspot(duration: float) -> None:
+    """
+    Spin in pure Python code, like a slow game update would.
+
+    Args:
+        duration (float): Seconds to spin for.
+    """
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+if __name__ == "__main__":
+    # Self-check: a pure-Python hotspot next to C-heavy drawing must show up
+    # in the collapsed stacks, not only the functions that call into pygame.
+    import tempfile
+    from sys import exit
+    from types import SimpleNamespace
+
+    import pygame
+
+    from config import GameConfiguration
+
+    settings = GameConfiguration()
+    settings.profile_output_dir = tempfile.mkdtemp()
+    capture = ProfilerCapture(SimpleNamespace(settings=settings))
+    screen = pygame.Surface((settings.screen_width, settings.screen_height))
+
+    capture.start()
+    while capture.active:
+        python_hotspot(0.004)
+        screen.blit(settings.bg_image, (0, 0))
+        capture.frame_done()
+
+    with open(f"{capture.last_capture}.collapsed", encoding="utf-8") as stacks_file:
+        stacks = [line.rsplit(" ", 1) for line in stacks_file]
+    total = sum(int(count) for _, count in stacks)
+    hotspot = sum(int(count) for stack, count in stacks if "python_hotspot" in stack)
+
+    print(f"{hotspot} of {total} samples in python_hotspot ({capture.last_capture})")
+    exit(0 if hotspot else 1)
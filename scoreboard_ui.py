@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 # To avoid circular imports during runtime
 if TYPE_CHECKING:
     from game_stats import GameStats
+    from sprite_atlas import SpriteAtlas
     from config import GameConfiguration
     from space_invaders import SpaceInvaders
 
@@ -34,9 +35,15 @@ class Scoreboard:
 
         # Font and color settings for score and level elements.
         self.font_color = (255, 255, 255)
-        self.stage_font = pygame.font.Font("font/RetroGaming.ttf", 20)
-        self.score_font = pygame.font.Font("font/RetroGaming.ttf", 35)
-        self.highscore_font = pygame.font.Font("font/RetroGaming.ttf", 22)
+        self.stage_font_size: int = self.settings.scoreboard_font_sizes["stage"]
+        self.score_font_size: int = self.settings.scoreboard_font_sizes["score"]
+        self.highscore_font_size: int = self.settings.scoreboard_font_sizes["highscore"]
+        self.stage_font = pygame.font.Font(self.settings.font_path, self.stage_font_size)
+        self.score_font = pygame.font.Font(self.settings.font_path, self.score_font_size)
+        self.highscore_font = pygame.font.Font(
+            self.settings.font_path, self.highscore_font_size
+        )
+        self.atlas: SpriteAtlas = self.settings.atlas
 
         # Prepare the intial rendered images.
         self.prepare_player_score()
@@ -44,12 +51,30 @@ class Scoreboard:
         self.prepare_stage()
         self.prep_starfighters_left()
 
+    def render_text(self, text: str, font: pygame.font.Font, size: int) -> pygame.Surface:
+        """
+        Render text using the atlas glyphs if available, or the font otherwise.
+
+        Args:
+            text (str): The text to render.
+            font (pygame.font.Font): The font to use when the atlas has no glyphs.
+            size (int): The point size the font was created with.
+
+        Returns:
+            pygame.Surface: The rendered text on the background color.
+        """
+        if self.atlas.has_glyphs(size):
+            return self.atlas.render_text(
+                text, size, self.font_color, self.settings.bg_color
+            )
+        return font.render(text, True, self.font_color, self.settings.bg_color)
+
     def prepare_player_score(self) -> None:
         """Render the current score as an image and position it at the top-right corner."""
         rounded_score = round(self.stats.score, -1)
         score_str = f"{rounded_score:,}"
-        self.player_score_img = self.score_font.render(
-            score_str, True, self.font_color, self.settings.bg_color
+        self.player_score_img = self.render_text(
+            score_str, self.score_font, self.score_font_size
         )
 
         # Display the score at the top-right corner of the screen.
@@ -73,8 +98,8 @@ class Scoreboard:
         """
         highscore = round(self.stats.highscore, -1)
         highscore_str = f"highscore: {highscore:,}"
-        self.highscore_img = self.highscore_font.render(
-            highscore_str, True, self.font_color, self.settings.bg_color
+        self.highscore_img = self.render_text(
+            highscore_str, self.highscore_font, self.highscore_font_size
         )
 
         # Center the high score near the top of the screen.
@@ -91,8 +116,8 @@ class Scoreboard:
     def prepare_stage(self) -> None:
         """Render the current stage level as an image and position it below the high score."""
         stage_str = f"stage {self.stats.level}"
-        self.stage_image = self.stage_font.render(
-            stage_str, True, self.font_color, self.settings.bg_color
+        self.stage_image = self.render_text(
+            stage_str, self.stage_font, self.stage_font_size
         )
 
         # Position the stage text below the high score.
@@ -104,7 +129,7 @@ class Scoreboard:
         """Show the number of starfighters left as small icons at the top-left corner."""
         self.starfighters: pygame.sprite.Group = Group()
         for starfighter_number in range(self.stats.starfighter_left):
-            starfighter = Starfighter(self.game, "images/ships_left.png")
+            starfighter = Starfighter(self.game, "ships_left")
             starfighter.rect.x = 20 + starfighter_number * (starfighter.rect.width + 10)
             starfighter.rect.y = self.highscore_rect.top
             self.starfighters.add(starfighter)
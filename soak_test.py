@@ -0,0 +1,346 @@
+# soak_test.py
+# A module defining the SoakTest class for long-run memory and object-count checks of the Space Invaders game.
+
+import os
+
+# Run without a window or audio device; must be set before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import gc
+import argparse
+import tracemalloc
+from sys import exit
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pygame
+
+from space_invaders import SpaceInvaders
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
+
+FRAMES_PER_SECOND = 60
+
+
+@dataclass
+class SoakSample:
+    """A single measurement of the game's memory footprint."""
+
+    frame: int
+    traced_bytes: int
+    rss_bytes: int
+    object_counts: Counter = field(repr=False)
+    snapshot: tracemalloc.Snapshot = field(repr=False)
+
+    @property
+    def total_objects(self) -> int:
+        """Return the number of objects tracked by the garbage collector."""
+        return sum(self.object_counts.values())
+
+
+class SoakBot:
+    """Play the game by posting keyboard and mouse events, like a real player."""
+
+    def __init__(self, game_instance: SpaceInvaders) -> None:
+        """
+        Initialize the bot.
+
+        Args:
+            game_instance (SpaceInvaders): The game instance the bot plays.
+        """
+        self.game = game_instance
+        self.direction = pygame.K_RIGHT
+        self.frame = 0
+
+    def act(self) -> None:
+        """Post the input events for the current frame."""
+        self.frame += 1
+
+        # Restart the game whenever the bot runs out of starfighters.
+        if not self.game.game_is_active:
+            self.post_click()
+            return
+
+        # Sweep the starfighter from edge to edge.
+        starfighter_rect = self.game.starfighter.rect
+        screen_rect = self.game.starfighter.screen_rect
+        if self.direction == pygame.K_RIGHT and starfighter_rect.right >= screen_rect.right:
+            self.turn(pygame.K_LEFT)
+        elif self.direction == pygame.K_LEFT and starfighter_rect.left <= 0:
+            self.turn(pygame.K_RIGHT)
+        elif self.frame == 1:
+            self.post_key(pygame.KEYDOWN, self.direction)
+
+        # Fire a few times per second.
+        if self.frame % 10 == 0:
+            self.post_key(pygame.KEYDOWN, pygame.K_SPACE)
+            self.post_key(pygame.KEYUP, pygame.K_SPACE)
+
+    def turn(self, new_direction: int) -> None:
+        """
+        Release the current direction key and press the opposite one.
+
+        Args:
+            new_direction (int): The key code of the new movement direction.
+        """
+        self.post_key(pygame.KEYUP, self.direction)
+        self.direction = new_direction
+        self.post_key(pygame.KEYDOWN, self.direction)
+
+    def post_click(self) -> None:
+        """Click the Play button."""
+        pygame.event.post(
+            pygame.event.Event(
+                pygame.MOUSEBUTTONDOWN, pos=self.game.play_button.rect.center, button=1
+            )
+        )
+        self.frame = 0
+
+    @staticmethod
+    def post_key(event_type: int, key: int) -> None:
+        """
+        Post a keyboard event to the pygame event queue.
+
+        Args:
+            event_type (int): pygame.KEYDOWN or pygame.KEYUP.
+            key (int): The key code of the event.
+        """
+        pygame.event.post(pygame.event.Event(event_type, key=key))
+
+
+class SoakTest:
+    """Run the headless game for many simulated hours and watch for memory growth."""
+
+    def __init__(
+        self,
+        hours: float,
+        sample_minutes: float,
+        memory_threshold_kb: int,
+        object_threshold: int,
+        rss_threshold_kb: int,
+        sustained_samples: int,
+        render_every: int,
+    ) -> None:
+        """
+        Initialize the soak test.
+
+        Args:
+            hours (float): Simulated hours of play at 60 frames per second.
+            sample_minutes (float): Simulated minutes between samples.
+            memory_threshold_kb (int): Allowed growth of traced Python memory.
+            object_threshold (int): Allowed growth of gc-tracked objects.
+            rss_threshold_kb (int): Allowed growth of the process resident set size.
+            sustained_samples (int): Consecutive samples over a threshold that fail the test.
+            render_every (int): Render one frame out of this many. The rebuilds the
+            soak test watches happen in the update, so rendering less often lets
+            simulated time run faster than real time.
+        """
+        self.total_frames = int(hours * 3600 * FRAMES_PER_SECOND)
+        self.sample_every = max(1, int(sample_minutes * 60 * FRAMES_PER_SECOND))
+        self.memory_threshold = memory_threshold_kb * 1024
+        self.object_threshold = object_threshold
+        self.rss_threshold = rss_threshold_kb * 1024
+        self.sustained_samples = sustained_samples
+        self.render_every = max(1, render_every)
+
+        self.game = SpaceInvaders()
+        self.bot = SoakBot(self.game)
+
+        # Losing a starfighter must not stall the simulation.
+        self.game.settings.starfighter_hit_pause = 0
+
+        # Only the baseline and latest samples are kept, since snapshots are traced too.
+        self.baseline: Optional[SoakSample] = None
+        self.latest: Optional[SoakSample] = None
+        self.failures_in_a_row = 0
+
+        # Gameplay counters proving the soak exercised more than the menu screen.
+        self.games_started = 0
+        self.starfighters_lost = 0
+
+    def run(self) -> bool:
+        """
+        Run the game loop for the configured number of frames.
+
+        Returns:
+            bool: True if the bot played and memory stayed within the thresholds,
+            False otherwise.
+        """
+        tracemalloc.start()
+
+        for frame in range(1, self.total_frames + 1):
+            was_active = self.game.game_is_active
+            starfighters_left = self.game.game_stats.starfighter_left
+
+            self.bot.act()
+            self.game.check_events()
+            if self.game.game_is_active:
+                self.game.update_game()
+            if frame % self.render_every == 0:
+                self.game.update_screen()
+
+            self.count_gameplay(was_active, starfighters_left)
+
+            if frame % self.sample_every == 0 and not self.record_sample(frame):
+                self.report_failure()
+                return False
+
+        tracemalloc.stop()
+
+        if self.games_started == 0 or self.starfighters_lost == 0:
+            print(
+                f"Soak test failed: {self.games_started} games started and "
+                f"{self.starfighters_lost} starfighters lost, so the fleet and "
+                f"scoreboard rebuilds were never exercised."
+            )
+            return False
+
+        print(
+            f"Soak test passed after {self.total_frames:,} frames "
+            f"({self.games_started:,} games, {self.starfighters_lost:,} starfighters lost)."
+        )
+        return True
+
+    def count_gameplay(self, was_active: bool, starfighters_left: int) -> None:
+        """
+        Count games started and starfighters lost during the last frame.
+
+        Args:
+            was_active (bool): Whether a game was running before the frame.
+            starfighters_left (int): Starfighters left before the frame.
+        """
+        if not was_active:
+            if self.game.game_is_active:
+                self.games_started += 1
+        elif not self.game.game_is_active:
+            # The last starfighter was lost and the game ended.
+            self.starfighters_lost += 1
+        elif self.game.game_stats.starfighter_left < starfighters_left:
+            self.starfighters_lost += 1
+
+    def record_sample(self, frame: int) -> bool:
+        """
+        Take a sample and compare it with the baseline.
+
+        Args:
+            frame (int): The number of frames simulated so far.
+
+        Returns:
+            bool: False once growth has stayed over a threshold for too long.
+        """
+        gc.collect()
+        sample = SoakSample(
+            frame=frame,
+            traced_bytes=tracemalloc.get_traced_memory()[0],
+            rss_bytes=self.read_rss(),
+            object_counts=Counter(type(obj).__name__ for obj in gc.get_objects()),
+            snapshot=tracemalloc.take_snapshot(),
+        )
+        self.latest = sample
+
+        # The first sample, taken after a full interval of play, is the baseline.
+        if self.baseline is None:
+            self.baseline = sample
+            print(f"frame {frame:>10,}: baseline recorded")
+            return True
+
+        memory_growth = sample.traced_bytes - self.baseline.traced_bytes
+        object_growth = sample.total_objects - self.baseline.total_objects
+        rss_growth = sample.rss_bytes - self.baseline.rss_bytes
+        print(
+            f"frame {frame:>10,}: traced {memory_growth / 1024:+.1f} KiB, "
+            f"objects {object_growth:+,}, rss {rss_growth / 1024:+.1f} KiB"
+        )
+
+        over_threshold = (
+            memory_growth > self.memory_threshold
+            or object_growth > self.object_threshold
+            or rss_growth > self.rss_threshold
+        )
+        self.failures_in_a_row = self.failures_in_a_row + 1 if over_threshold else 0
+        return self.failures_in_a_row < self.sustained_samples
+
+    def report_failure(self) -> None:
+        """Print the allocation sites and object types that grew the most."""
+        latest = self.latest
+        print(
+            f"Soak test failed: growth stayed over the threshold for "
+            f"{self.sustained_samples} samples."
+        )
+
+        print("Top allocation growth:")
+        for stat in latest.snapshot.compare_to(self.baseline.snapshot, "lineno")[:10]:
+            print(f"  {stat}")
+
+        print("Top object count growth:")
+        type_growth = latest.object_counts - self.baseline.object_counts
+        for type_name, count in type_growth.most_common(10):
+            print(f"  {type_name}: +{count:,}")
+
+    @staticmethod
+    def read_rss() -> int:
+        """
+        Return the current resident set size of the process in bytes.
+
+        Returns:
+            int: The resident set size, or 0 if it cannot be determined.
+        """
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            pass
+
+        # Fall back to the peak RSS, reported in kilobytes on Linux.
+        if resource is not None:
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run the game headless with a bot and fail on sustained memory growth."
+    )
+    parser.add_argument("--hours", type=float, default=1.0, help="simulated hours of play")
+    parser.add_argument(
+        "--sample-minutes", type=float, default=5.0, help="simulated minutes between samples"
+    )
+    parser.add_argument(
+        "--memory-threshold-kb", type=int, default=512, help="allowed traced memory growth"
+    )
+    parser.add_argument(
+        "--object-threshold", type=int, default=2000, help="allowed gc object count growth"
+    )
+    parser.add_argument(
+        "--rss-threshold-kb", type=int, default=8192, help="allowed resident set growth"
+    )
+    parser.add_argument(
+        "--sustained-samples",
+        type=int,
+        default=3,
+        help="consecutive samples over a threshold before failing",
+    )
+    parser.add_argument(
+        "--render-every",
+        type=int,
+        default=60,
+        help="render one frame out of this many (1 renders every frame)",
+    )
+    args = parser.parse_args()
+
+    soak_test = SoakTest(
+        args.hours,
+        args.sample_minutes,
+        args.memory_threshold_kb,
+        args.object_threshold,
+        args.rss_threshold_kb,
+        args.sustained_samples,
+        args.render_every,
+    )
+    exit(0 if soak_test.run() else 1)
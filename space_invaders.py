@@ -3,16 +3,20 @@
 
 import pygame
 from sys import exit
-from time import sleep
-from typing import Tuple
+from time import sleep, perf_counter
+from typing import List, Tuple
 
 from bullet import Bullet
+from enemy_fire import EnemyProjectiles
 from invader import Invader
 from button_ui import Button
 from game_stats import GameStats
 from starfighter import Starfighter
 from scoreboard_ui import Scoreboard
 from config import GameConfiguration
+from frame_pacing import FramePacer
+from input_latency import InputLatencyTracker
+from profiler_capture import ProfilerCapture
 
 
 class SpaceInvaders:
@@ -43,25 +47,61 @@ class SpaceInvaders:
         self.score_board = Scoreboard(self)
 
         # Player's starfighter and sprite groups for bullets and invaders.
-        self.starfighter = Starfighter(self, "images/starfighter.png")
+        self.starfighter = Starfighter(self, "starfighter")
         self.bullets = pygame.sprite.Group()
         self.invaders = pygame.sprite.Group()
+        self.enemy_shots = EnemyProjectiles(self)
+
+        # Precomputed fleet layout and the invaders reused for every new fleet.
+        self.fleet_template_key = None
+        self.fleet_template: List[Tuple[int, int]] = []
+        self.fleet_pool: List[Invader] = []
 
         # Create the initial fleet of invaders.
         self.create_invaders_fleet()
 
+        # On-demand profiler, idle until the capture hotkey is pressed.
+        self.profiler_capture = ProfilerCapture(self)
+
+        # Input-to-photon latency measurement when enabled in the settings.
+        self.latency_tracker = (
+            InputLatencyTracker(self) if self.settings.track_input_latency else None
+        )
+
+        # Adaptive pacer replacing clock.tick when enabled in the settings. Created
+        # last so its first deadline is not already spent on loading resources.
+        self.frame_pacer = FramePacer(self) if self.settings.adaptive_pacing else None
+
     def run_the_game(self) -> None:
         """Start the main loop for the game."""
         while True:
             self.check_events()
 
             if self.game_is_active:
-                self.starfighter.update()
-                self.update_bullets()
-                self.update_invaders()
-
-            self.update_screen()
-            self.clock.tick(60)
+                self.update_game()
+
+            if self.frame_pacer is None:
+                self.update_screen()
+                self.clock.tick(self.settings.target_fps)
+            else:
+                if self.frame_pacer.should_render():
+                    self.update_screen()
+                    self.frame_pacer.frame_rendered()
+                self.frame_pacer.wait_for_next_frame()
+
+            if self.profiler_capture.active:
+                self.profiler_capture.frame_done()
+
+    def update_game(self) -> None:
+        """Advance the starfighter, bullets and invaders by one frame."""
+        starfighter_x = self.starfighter.x
+        self.starfighter.update()
+        if self.latency_tracker is not None and self.starfighter.x != starfighter_x:
+            self.latency_tracker.mark_applied("move")
+
+        self.update_bullets()
+        self.update_invaders()
+        self.update_enemy_shots()
 
     def update_screen(self) -> None:
         """Update images on the screen and flip to the new screen."""
@@ -71,6 +111,9 @@ class SpaceInvaders:
         for bullet in self.bullets:
             bullet.draw_bullet()
 
+        # Draw the invaders' shots.
+        self.enemy_shots.draw_shots()
+
         # Draw the starfighter.
         self.starfighter.blit_me()
 
@@ -88,22 +131,30 @@ class SpaceInvaders:
         # Display the most recently drawn screen.
         pygame.display.flip()
 
+        if self.latency_tracker is not None:
+            self.latency_tracker.frame_presented()
+
     def check_events(self) -> None:
         """Respond to keypresses and mouse events."""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        pulled_at = perf_counter()
+
+        for event in events:
             if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
+                self.quit_game()
 
             elif event.type == pygame.KEYDOWN:
+                if self.latency_tracker is not None:
+                    self.latency_tracker.key_pressed(event.key, pulled_at)
                 self.check_keydown_events(event)
 
             elif event.type == pygame.KEYUP:
+                if self.latency_tracker is not None:
+                    self.latency_tracker.key_released(event.key)
                 self.check_keyup_events(event)
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                self.check_play_button(mouse_pos)
+                self.check_play_button(event.pos)
 
     def check_keydown_events(self, event: pygame.event.Event) -> None:
         """
@@ -119,12 +170,14 @@ class SpaceInvaders:
             self.starfighter.moving_left = True
 
         elif event.key == pygame.K_q:
-            pygame.quit()
-            exit()
+            self.quit_game()
 
         elif event.key == pygame.K_SPACE:
             self.fire_bullet()
 
+        elif event.key == pygame.K_p:
+            self.profiler_capture.start()
+
     def check_keyup_events(self, event: pygame.event.Event) -> None:
         """
         Respond to key release events.
@@ -138,6 +191,15 @@ class SpaceInvaders:
         elif event.key == pygame.K_LEFT:
             self.starfighter.moving_left = False
 
+    def quit_game(self) -> None:
+        """Finish any active measurements and close the game."""
+        self.profiler_capture.stop()
+        if self.latency_tracker is not None:
+            self.latency_tracker.write_report()
+
+        pygame.quit()
+        exit()
+
     def check_play_button(self, mouse_pos: Tuple[int, int]) -> None:
         """
         Start a new game when the player clicks the Play button.
@@ -156,9 +218,10 @@ class SpaceInvaders:
             self.score_board.prep_starfighters_left()
             self.game_is_active = True
 
-            # Clear old bullets and invaders.
+            # Clear old bullets, invaders and invader shots.
             self.bullets.empty()
             self.invaders.empty()
+            self.enemy_shots.clear()
 
             # Create a new fleet and center the starfighter.
             self.create_invaders_fleet()
@@ -179,52 +242,87 @@ class SpaceInvaders:
         """
         if row_number == 0:
             return Invader(
-                self, "images/invader1_frame1.png", "images/invader1_frame2.png"
+                self, "invader1_frame1", "invader1_frame2"
             )
 
         elif row_number == 1 or row_number == 2:
             return Invader(
-                self, "images/invader2_frame1.png", "images/invader2_frame2.png"
+                self, "invader2_frame1", "invader2_frame2"
             )
 
         else:
             return Invader(
-                self, "images/invader3_frame1.png", "images/invader3_frame2.png"
+                self, "invader3_frame1", "invader3_frame2"
             )
 
-    def create_invader(self, current_x: int, current_y: int, row_number: int) -> None:
+    def create_invader(
+        self, current_x: int, current_y: int, row_number: int, column_number: int
+    ) -> None:
         """
-        Create an invader and add it to the fleed at a specified position.
+        Create an invader and add it to the fleet pool at a specified position.
 
         Args:
             current_x (int): The x-coordinate for the invaders position.
             current_y (int): The y-coordinate for the invaders position.
             row_number (int): The current row number of the invader.
+            column_number (int): The current column number of the invader.
         """
         new_invader: Invader = self.load_invader_image(row_number)
-        new_invader.x = current_x
-        new_invader.rect.x = current_x
-        new_invader.rect.y = current_y
+        new_invader.reset_invader(current_x, current_y)
+        new_invader.column = column_number
 
-        # Add the new invader to the invaders group.
-        self.invaders.add(new_invader)
+        # Keep the invader in the pool so later fleets can reuse it.
+        self.fleet_template.append((current_x, current_y))
+        self.fleet_pool.append(new_invader)
 
-    def create_invaders_fleet(self) -> None:
-        """Create a full fleet of invaders and arrange them on the screen."""
+    def build_fleet_template(self) -> None:
+        """
+        Compute the fleet layout and create one invader for each slot.
+
+        The layout only depends on the screen size and the invader dimensions,
+        so it is built once and reused by every later call to create_invaders_fleet.
+        """
         invaders_width: int = self.settings.invaders_png_width
         invaders_height: int = self.settings.invaders_png_height
 
+        self.fleet_template = []
+        self.fleet_pool = []
+        self.fleet_template_key = (
+            self.settings.screen_width,
+            self.settings.screen_height,
+            invaders_width,
+            invaders_height,
+        )
+
         current_x: int = invaders_width
         current_y: int = 2 * invaders_height
         for row in range(5):
+            column = 0
             while current_x < (self.settings.screen_width - 2 * invaders_width):
-                self.create_invader(current_x, current_y, row)
+                self.create_invader(current_x, current_y, row, column)
                 current_x += 2 * invaders_width
+                column += 1
 
             # Finished a row. Reset x value, and increment y value.
             current_x = invaders_width
             current_y += 2 * invaders_height
 
+    def create_invaders_fleet(self) -> None:
+        """Create a full fleet of invaders and arrange them on the screen."""
+        template_key = (
+            self.settings.screen_width,
+            self.settings.screen_height,
+            self.settings.invaders_png_width,
+            self.settings.invaders_png_height,
+        )
+        if self.fleet_template_key != template_key:
+            self.build_fleet_template()
+
+        # Move every pooled invader back to its slot instead of loading new ones.
+        for invader, (slot_x, slot_y) in zip(self.fleet_pool, self.fleet_template):
+            invader.reset_invader(slot_x, slot_y)
+        self.invaders.add(self.fleet_pool)
+
     def check_fleet_edges(self) -> None:
         """Respond appropriately if any invaders have reached an edge of the screen."""
         for invader in self.invaders:
@@ -250,12 +348,26 @@ class SpaceInvaders:
         # Check for invaders reaching the bottom of the screen.
         self.check_invaders_bottom()
 
+    def update_enemy_shots(self) -> None:
+        """Let the invaders fire, move their shots and check for starfighter hits."""
+        if not self.game_is_active:
+            return
+
+        self.enemy_shots.fire(self.invaders)
+        self.enemy_shots.update()
+
+        if self.enemy_shots.check_hit(self.starfighter.rect):
+            self.is_starfighter_hit()
+
     def fire_bullet(self) -> None:
         """Fire a bullet if the limit on bullets has not been reached yet."""
         if len(self.bullets) < self.settings.bullets_allowed:
             new_bullet = Bullet(self)
             self.bullets.add(new_bullet)
 
+            if self.latency_tracker is not None:
+                self.latency_tracker.mark_applied("fire")
+
     def update_bullets(self) -> None:
         """Update position of bullets and get rid of old bullets."""
         self.bullets.update()
@@ -285,6 +397,7 @@ class SpaceInvaders:
         if not self.invaders:
             # All invaders destroyed: reset fleet and advance level.
             self.bullets.empty()
+            self.enemy_shots.clear()
             self.create_invaders_fleet()
             self.settings.increase_speed()
 
@@ -303,17 +416,19 @@ class SpaceInvaders:
             self.game_stats.starfighter_left -= 1
             self.score_board.prep_starfighters_left()
 
-            # Remove any remaining bullets and invaders.
+            # Remove any remaining bullets, invaders and invader shots.
             self.bullets.empty()
             self.invaders.empty()
+            self.enemy_shots.clear()
 
             # Create a new fleet and center the starfighter.
             self.create_invaders_fleet()
             self.starfighter.center_starfighter()
 
-            sleep(1)
+            sleep(self.settings.starfighter_hit_pause)
         else:
             self.game_is_active = False
+            self.enemy_shots.clear()
             pygame.mouse.set_visible(True)
 
     def check_invaders_bottom(self) -> None:
@@ -0,0 +1,273 @@
+# sprite_atlas.py
+# A module defining the SpriteAtlas class for loading all game images from a single bundle file.
+
+import os
+import json
+import glob
+import zlib
+import struct
+import argparse
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+# Bundle layout: magic, header length, JSON header, then zlib-compressed RGBA pixels.
+BUNDLE_MAGIC = b"SIATLAS2"
+HEADER_LENGTH = struct.Struct("<I")
+
+# Images that are only used outside the game, such as the README preview.
+EXCLUDED_IMAGES = {"space-invaders-preview"}
+
+# Characters pre-rendered for each font size when glyphs are packed.
+GLYPH_CHARACTERS = "".join(chr(code) for code in range(32, 127))
+
+Region = Tuple[int, int, int, int]
+
+
+class SpriteAtlas:
+    """
+    Provide game images as subsurfaces of one texture atlas.
+
+    If no bundle file exists, images are loaded from the images/ directory
+    instead, and each one is loaded only once.
+    """
+
+    def __init__(
+        self,
+        atlas_image: Optional[pygame.Surface] = None,
+        sprites: Optional[Dict[str, Region]] = None,
+        glyphs: Optional[Dict[int, Dict[str, Region]]] = None,
+    ) -> None:
+        """
+        Initialize the atlas.
+
+        Args:
+            atlas_image (Optional[pygame.Surface]): The packed atlas surface, or None
+            to load images from individual files.
+            sprites (Optional[Dict[str, Region]]): Named sprite regions in the atlas.
+            glyphs (Optional[Dict[int, Dict[str, Region]]]): Glyph regions per font size.
+        """
+        self.atlas_image = atlas_image
+        self.sprites: Dict[str, Region] = sprites or {}
+        self.glyphs: Dict[int, Dict[str, Region]] = glyphs or {}
+        self.cache: Dict[str, pygame.Surface] = {}
+
+    @classmethod
+    def load(cls, bundle_path: str) -> "SpriteAtlas":
+        """
+        Load an atlas bundle with a single read, or fall back to individual files.
+
+        Args:
+            bundle_path (str): Path to the bundle written by this module's build step.
+
+        Returns:
+            SpriteAtlas: The loaded atlas.
+        """
+        if not os.path.exists(bundle_path):
+            return cls()
+
+        with open(bundle_path, "rb") as bundle_file:
+            data = bundle_file.read()
+
+        if not data.startswith(BUNDLE_MAGIC):
+            raise ValueError(f"{bundle_path} is not a sprite atlas bundle.")
+
+        header_start = len(BUNDLE_MAGIC) + HEADER_LENGTH.size
+        (header_length,) = HEADER_LENGTH.unpack_from(data, len(BUNDLE_MAGIC))
+        header = json.loads(data[header_start : header_start + header_length])
+
+        # The surface shares the decompressed buffer instead of copying it.
+        pixels = zlib.decompress(data[header_start + header_length :])
+        atlas_image = pygame.image.frombuffer(pixels, tuple(header["size"]), "RGBA")
+
+        sprites = {name: tuple(region) for name, region in header["sprites"].items()}
+        glyphs = {
+            int(size): {char: tuple(region) for char, region in regions.items()}
+            for size, regions in header["glyphs"].items()
+        }
+        return cls(atlas_image, sprites, glyphs)
+
+    def image(self, name: str) -> pygame.Surface:
+        """
+        Return the image with the given name.
+
+        Args:
+            name (str): The image's file name in images/ without the extension.
+
+        Returns:
+            pygame.Surface: A subsurface of the atlas, or the loaded image file.
+        """
+        image = self.cache.get(name)
+        if image is None:
+            if name in self.sprites:
+                image = self.atlas_image.subsurface(self.sprites[name])
+            else:
+                image = pygame.image.load(f"images/{name}.png")
+            self.cache[name] = image
+        return image
+
+    def has_glyphs(self, size: int) -> bool:
+        """
+        Check whether pre-rendered glyphs exist for a font size.
+
+        Args:
+            size (int): The font size in points.
+
+        Returns:
+            bool: True if text of this size can be rendered from the atlas.
+        """
+        return size in self.glyphs
+
+    def render_text(
+        self,
+        text: str,
+        size: int,
+        color: Tuple[int, int, int],
+        background: Tuple[int, int, int],
+    ) -> pygame.Surface:
+        """
+        Render text by copying pre-rendered glyphs from the atlas.
+
+        Args:
+            text (str): The text to render.
+            size (int): The font size in points.
+            color (Tuple[int, int, int]): The text color.
+            background (Tuple[int, int, int]): The background color.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        regions = self.glyphs[size]
+        missing = regions["?"]
+        letters = [regions.get(char, missing) for char in text]
+
+        width = sum(region[2] for region in letters)
+        height = max((region[3] for region in letters), default=regions[" "][3])
+        text_image = pygame.Surface((width, height))
+        text_image.fill(background)
+
+        # Glyphs are stored in white, so tint a copy before compositing.
+        glyph_layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for region in letters:
+            glyph_layer.blit(self.atlas_image, (x, 0), region)
+            x += region[2]
+        glyph_layer.fill((*color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+
+        text_image.blit(glyph_layer, (0, 0))
+        return text_image
+
+
+def pack_regions(
+    sizes: Dict[str, Tuple[int, int]], padding: int = 1
+) -> Tuple[Tuple[int, int], Dict[str, Region]]:
+    """
+    Pack rectangles into rows, tallest first.
+
+    Args:
+        sizes (Dict[str, Tuple[int, int]]): The width and height of each named image.
+        padding (int): Empty pixels left between neighbouring images.
+
+    Returns:
+        Tuple[Tuple[int, int], Dict[str, Region]]: The atlas size and the
+        region assigned to each name.
+    """
+    atlas_width = max(max(width for width, _ in sizes.values()), 1024)
+    regions: Dict[str, Region] = {}
+
+    x = y = row_height = 0
+    for name, (width, height) in sorted(
+        sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])
+    ):
+        if x + width > atlas_width:
+            # Row is full. Start a new row below the tallest image in it.
+            x = 0
+            y += row_height + padding
+            row_height = 0
+
+        regions[name] = (x, y, width, height)
+        x += width + padding
+        row_height = max(row_height, height)
+
+    return (atlas_width, y + row_height), regions
+
+
+def build_bundle(bundle_path: str, font_path: str, glyph_sizes: Iterable[int]) -> None:
+    """
+    Pack every game image, and optionally the font glyphs, into one bundle file.
+
+    Args:
+        bundle_path (str): Where to write the bundle.
+        font_path (str): The font to pre-render glyphs from.
+        glyph_sizes (Iterable[int]): Font sizes to pre-render glyphs for; empty
+        to pack images only.
+    """
+    pygame.font.init()
+
+    images: Dict[str, pygame.Surface] = {}
+    for image_path in sorted(glob.glob("images/*.png")):
+        name = os.path.splitext(os.path.basename(image_path))[0]
+        if name not in EXCLUDED_IMAGES:
+            images[name] = pygame.image.load(image_path)
+
+    glyph_images: Dict[str, pygame.Surface] = {}
+    glyph_keys: List[Tuple[int, str, str]] = []
+    for size in sorted(set(glyph_sizes)):
+        font = pygame.font.Font(font_path, size)
+        for char in GLYPH_CHARACTERS:
+            key = f"glyph:{size}:{ord(char)}"
+            glyph_images[key] = font.render(char, True, (255, 255, 255))
+            glyph_keys.append((size, char, key))
+
+    all_images = {**images, **glyph_images}
+    atlas_size, regions = pack_regions(
+        {name: image.get_size() for name, image in all_images.items()}
+    )
+
+    atlas_image = pygame.Surface(atlas_size, pygame.SRCALPHA)
+    for name, image in all_images.items():
+        atlas_image.blit(image, regions[name][:2])
+
+    glyphs: Dict[int, Dict[str, Region]] = {}
+    for size, char, key in glyph_keys:
+        glyphs.setdefault(size, {})[char] = regions[key]
+
+    header = json.dumps(
+        {
+            "size": atlas_size,
+            "sprites": {name: regions[name] for name in images},
+            "glyphs": glyphs,
+        }
+    ).encode("utf-8")
+
+    with open(bundle_path, "wb") as bundle_file:
+        bundle_file.write(BUNDLE_MAGIC)
+        bundle_file.write(HEADER_LENGTH.pack(len(header)))
+        bundle_file.write(header)
+        bundle_file.write(zlib.compress(pygame.image.tobytes(atlas_image, "RGBA")))
+
+    print(
+        f"Packed {len(images)} images and {len(glyph_images)} glyphs into "
+        f"{atlas_size[0]}x{atlas_size[1]} atlas at {bundle_path} "
+        f"({os.path.getsize(bundle_path):,} bytes)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Pack the game images into a single sprite atlas bundle."
+    )
+    parser.add_argument(
+        "--output", default="images/sprites.atlas", help="path of the bundle to write"
+    )
+    parser.add_argument(
+        "--glyphs", action="store_true", help="also pre-render the scoreboard font glyphs"
+    )
+    args = parser.parse_args()
+
+    # Glyph sizes come from the same settings the scoreboard creates its fonts with.
+    from config import GameConfiguration
+
+    settings = GameConfiguration()
+    glyph_sizes = settings.scoreboard_font_sizes.values() if args.glyphs else ()
+    build_bundle(args.output, settings.font_path, glyph_sizes)
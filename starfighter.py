@@ -16,7 +16,7 @@ if TYPE_CHECKING:
 class Starfighter(Sprite):
     """A class to manage the starfighter."""
 
-    def __init__(self, game_instance: SpaceInvaders, image_path: str) -> None:
+    def __init__(self, game_instance: SpaceInvaders, image_name: str) -> None:
         super().__init__()
         """ 
         Initialize the starfighter and set its starting position. 
@@ -24,14 +24,14 @@ class Starfighter(Sprite):
         Args:
             game_instance (SpaceInvaders): The current game instance, providing
             access to the screen and settings.
-            image_path (str): The file path to the starfighter image.
+            image_name (str): The name of the starfighter image in the sprite atlas.
         """
         self.screen: pygame.Surface = game_instance.screen
         self.screen_rect = game_instance.screen.get_rect()
         self.settings: GameConfiguration = game_instance.settings
 
-        # Load the starfighter image and get its rect.
-        self.image: pygame.Surface = pygame.image.load(image_path)
+        # Get the starfighter image from the sprite atlas and get its rect.
+        self.image: pygame.Surface = self.settings.atlas.image(image_name)
         self.rect = self.image.get_rect()
 
         # Start each new starfighter at the bottom center of the screen.